@@ -1,97 +1,228 @@
 """Flask web application for KittenTTS text-to-speech synthesis."""
 
 import os
+import base64
 import io
 import json
+import hashlib
 import re
+import string
+import threading
+import time
 import unicodedata
-from flask import Flask, render_template, request, jsonify, send_file
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from multiprocessing import get_context
+from flask import Flask, render_template, request, jsonify, send_file, Response, stream_with_context
+from flask.json.provider import JSONProvider
 from kittentts import KittenTTS
 import soundfile as sf
 import numpy as np
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 app = Flask(__name__)
 
+
+class _OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson's C encoder/decoder.
+
+    Routes request.get_json and jsonify through orjson — a small win on every
+    request, and a larger one when serializing the base64 audio payload.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+if orjson is not None:
+    app.json = _OrjsonProvider(app)
+
 # Initialize KittenTTS model (using nano version for speed)
 MODEL_NAME = "KittenML/kitten-tts-nano-0.8-fp32"
 tts = None
 
+# Serialize access to the model; Flask serves requests from multiple threads.
+_tts_lock = threading.Lock()
+
 # Available voices based on the model
 AVAILABLE_VOICES = [
     'Bella', 'Jasper', 'Luna', 'Bruno', 
     'Rosie', 'Hugo', 'Kiki', 'Leo'
 ]
 
-# Create output directory for audio files
+# Create output directory for audio files (doubles as on-disk WAV cache)
 OUTPUT_DIR = Path(__file__).parent / "generated_audio"
 OUTPUT_DIR.mkdir(exist_ok=True)
 
 MAX_TEXT_LEN = 1000
 SAFE_CHUNK_LEN = 180
 
+# Precompiled patterns for the per-request text pipeline
+_WS_RE = re.compile(r"\s+")
+_SENT_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+_UNSAFE_CHARS_RE = re.compile(r"[^A-Za-z0-9 .,!?;:'\"()\-]")
+
+# Translation table mapping every ASCII codepoint the model cannot handle to a
+# space; applied after the NFKD/ASCII fold in a single C-level pass.
+_KEEP_ASCII = set(string.ascii_letters + string.digits + " .,!?;:'\"()-")
+_SANITIZE_TT = str.maketrans({c: ' ' for c in map(chr, range(128)) if c not in _KEEP_ASCII})
+
+# Byte budget for cached audio files under OUTPUT_DIR before eviction kicks in
+CACHE_MAX_BYTES = int(os.getenv("KITTENTTS_CACHE_MAX_BYTES", 512 * 1024 * 1024))
+
+# A cache write takes well under a second; any .tmp file this old is an
+# orphan from a crashed writer and gets swept during eviction.
+_TMP_MAX_AGE_S = 3600
+
+# Encodings the API can emit: format -> (sf format, sf subtype, mimetype, extension).
+# Opus cuts wire bytes roughly 10x versus WAV at transparent speech quality.
+_AUDIO_FORMATS = {
+    'wav': ('WAV', None, 'audio/wav', '.wav'),
+    'ogg': ('OGG', 'OPUS', 'audio/ogg', '.ogg'),
+}
+
+
+def _probe_opus_support() -> bool:
+    """Check once whether the linked libsndfile can write OGG/Opus."""
+    try:
+        sf.write(io.BytesIO(), np.zeros(240, dtype=np.float32), 24000,
+                 format='OGG', subtype='OPUS')
+        return True
+    except Exception:
+        return False
+
+
+_OPUS_OK = _probe_opus_support()
+
+# Synthesis worker processes; 0 runs inference in-process under _tts_lock
+SYNTH_WORKERS = int(os.getenv("KITTENTTS_WORKERS", max(1, (os.cpu_count() or 2) // 2)))
+SYNTH_TIMEOUT_S = int(os.getenv("KITTENTTS_SYNTH_TIMEOUT", 60))
+
+_executor = None
+_executor_lock = threading.Lock()
+
 
 def _normalize_input_text(text: str) -> str:
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _WS_RE.sub(" ", text).strip()
     return text
 
 
 def _sanitize_text_for_model(text: str) -> str:
     normalized = unicodedata.normalize("NFKD", text)
     ascii_text = normalized.encode("ascii", "ignore").decode("ascii")
-    ascii_text = ascii_text.replace("\n", " ")
-    ascii_text = re.sub(r"[^A-Za-z0-9 .,!?;:'\"()\-]", " ", ascii_text)
-    ascii_text = re.sub(r"\s+", " ", ascii_text).strip()
+    ascii_text = ascii_text.translate(_SANITIZE_TT)
+    ascii_text = _WS_RE.sub(" ", ascii_text).strip()
     return ascii_text
 
 
 def _split_safe_chunks(text: str, max_len: int = SAFE_CHUNK_LEN) -> list[str]:
-    if len(text) <= max_len:
+    """Greedily pack sentences into chunks of at most max_len characters.
+
+    Operates on (start, end) offsets in a single scan — no per-word or
+    per-sentence string concatenation — and slices the input once per emitted
+    chunk. Assumes whitespace-collapsed input (both callers normalize first).
+    """
+    n = len(text)
+    if n <= max_len:
         return [text]
 
-    sentences = re.split(r"(?<=[.!?])\s+", text)
     chunks: list[str] = []
-    current = ""
-
-    for sentence in sentences:
-        sentence = sentence.strip()
-        if not sentence:
+    cur_start = cur_end = -1
+
+    i = 0
+    while i < n:
+        # Sentence span [s, e): ends after [.!?] followed by whitespace
+        while i < n and text[i].isspace():
+            i += 1
+        s = i
+        while i < n:
+            c = text[i]
+            i += 1
+            if c in '.!?' and i < n and text[i].isspace():
+                break
+        e = i
+        while e > s and text[e - 1].isspace():
+            e -= 1
+        if e <= s:
             continue
 
-        if len(sentence) > max_len:
-            words = sentence.split()
-            temp = ""
-            for word in words:
-                candidate = f"{temp} {word}".strip()
-                if len(candidate) <= max_len:
-                    temp = candidate
+        if e - s > max_len:
+            # Flush the running pack, then split the long sentence by words
+            if cur_start >= 0:
+                chunks.append(text[cur_start:cur_end])
+                cur_start = cur_end = -1
+
+            w_start = w_end = -1
+            j = s
+            while j < e:
+                while j < e and text[j].isspace():
+                    j += 1
+                word_start = j
+                while j < e and not text[j].isspace():
+                    j += 1
+                if word_start == j:
+                    break
+                if w_start < 0:
+                    w_start, w_end = word_start, j
+                elif j - w_start <= max_len:
+                    w_end = j
                 else:
-                    if temp:
-                        chunks.append(temp)
-                    temp = word
-            if temp:
-                chunks.append(temp)
+                    chunks.append(text[w_start:w_end])
+                    w_start, w_end = word_start, j
+            if w_start >= 0:
+                chunks.append(text[w_start:w_end])
             continue
 
-        candidate = f"{current} {sentence}".strip()
-        if len(candidate) <= max_len:
-            current = candidate
+        if cur_start < 0:
+            cur_start, cur_end = s, e
+        elif e - cur_start <= max_len:
+            cur_end = e
         else:
-            if current:
-                chunks.append(current)
-            current = sentence
+            chunks.append(text[cur_start:cur_end])
+            cur_start, cur_end = s, e
 
-    if current:
-        chunks.append(current)
+    if cur_start >= 0:
+        chunks.append(text[cur_start:cur_end])
 
     return chunks or [text[:max_len]]
 
 
+def _join_audio_chunks(chunk_audios: list[np.ndarray]) -> np.ndarray:
+    """Join audio chunks along the sample axis into one preallocated buffer."""
+    if len(chunk_audios) == 1:
+        return chunk_audios[0]
+
+    total = sum(chunk.shape[-1] for chunk in chunk_audios)
+    out = np.empty(chunk_audios[0].shape[:-1] + (total,), dtype=chunk_audios[0].dtype)
+    offset = 0
+    for chunk in chunk_audios:
+        n = chunk.shape[-1]
+        out[..., offset:offset + n] = chunk
+        offset += n
+    return out
+
+
+def _is_model_safe(text: str) -> bool:
+    """True when text is already within the model's ASCII charset (no sanitizing needed)."""
+    return text.isascii() and _UNSAFE_CHARS_RE.search(text) is None
+
+
 def _synthesize_audio_safe(model: KittenTTS, text: str, voice: str, speed: float) -> np.ndarray:
     try:
         return model.generate(text, voice=voice, speed=speed)
     except Exception as first_error:
-        sanitized = _sanitize_text_for_model(text)
+        # Already-clean text cannot change under sanitizing; skip the
+        # NFKD/translate pass and go straight to the chunked fallback.
+        sanitized = text if _is_model_safe(text) else _sanitize_text_for_model(text)
         if not sanitized:
             raise ValueError("Text contains unsupported characters for this model.") from first_error
 
@@ -101,8 +232,18 @@ def _synthesize_audio_safe(model: KittenTTS, text: str, voice: str, speed: float
             except Exception:
                 pass
 
+        chunks = _split_safe_chunks(sanitized)
+
+        # Batch all chunks into one call first: phonemization and per-chunk
+        # Python overhead are amortized across the whole list.
+        try:
+            return model.generate_batch(chunks, voice=voice, speed=speed)
+        except Exception:
+            pass
+
+        # Last resort: per-chunk loop that tolerates individual chunk failures
         chunk_audios = []
-        for chunk in _split_safe_chunks(sanitized):
+        for chunk in chunks:
             try:
                 chunk_audio = model.generate(chunk, voice=voice, speed=speed)
                 if chunk_audio is not None and getattr(chunk_audio, "size", 0) > 0:
@@ -111,24 +252,249 @@ def _synthesize_audio_safe(model: KittenTTS, text: str, voice: str, speed: float
                 continue
 
         if chunk_audios:
-            return np.concatenate(chunk_audios, axis=-1)
+            return _join_audio_chunks(chunk_audios)
 
         raise ValueError(
             "Model could not synthesize this text. Try shorter text or English-only phrasing."
         ) from first_error
 
 
+def _choose_audio_format(data: dict) -> str | None:
+    """Resolve the response encoding from the payload or the Accept header.
+
+    Returns None for an unknown explicit format; Opus requests quietly fall
+    back to WAV when libsndfile lacks the codec.
+    """
+    fmt = data.get('format', '')
+    if fmt:
+        if not isinstance(fmt, str) or fmt.lower() not in _AUDIO_FORMATS:
+            return None
+        fmt = fmt.lower()
+    else:
+        fmt = 'ogg' if 'audio/ogg' in request.headers.get('Accept', '') else 'wav'
+    if fmt == 'ogg' and not _OPUS_OK:
+        fmt = 'wav'
+    return fmt
+
+
+def _cache_path(text: str, voice: str, speed: float, fmt: str = 'wav') -> Path:
+    """Map a (text, voice, speed, format) request to its on-disk cache file."""
+    key = hashlib.sha1(f"{voice}|{speed:.2f}|{text}".encode()).hexdigest()
+    return OUTPUT_DIR / f"{key}{_AUDIO_FORMATS[fmt][3]}"
+
+
+def _evict_cache_if_needed() -> None:
+    """Drop least-recently-used cached audio once OUTPUT_DIR exceeds its byte budget."""
+    suffixes = {spec[3] for spec in _AUDIO_FORMATS.values()}
+    files = []
+    try:
+        for p in OUTPUT_DIR.iterdir():
+            try:
+                if p.suffix in suffixes:
+                    files.append((p, p.stat()))
+                elif p.suffix == ".tmp" and time.time() - p.stat().st_mtime > _TMP_MAX_AGE_S:
+                    # Orphan left behind by a crashed writer
+                    p.unlink()
+            except OSError:
+                continue
+    except OSError:
+        return
+
+    total = sum(st.st_size for _, st in files)
+    if total <= CACHE_MAX_BYTES:
+        return
+
+    # Oldest access first; stop as soon as we are back under budget
+    files.sort(key=lambda item: item[1].st_atime)
+    for path, st in files:
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= st.st_size
+        if total <= CACHE_MAX_BYTES:
+            break
+
+
+def _store_audio_in_cache(path: Path, audio_bytes: bytes) -> None:
+    """Atomically write encoded audio into the on-disk cache."""
+    # Keep the full name (including the format suffix) plus the pid so
+    # concurrent writers of e.g. <key>.wav and <key>.ogg never share a temp
+    # file and clobber each other's bytes mid-write.
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_bytes(audio_bytes)
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        return
+    _evict_cache_if_needed()
+
+
+# Per-thread scratch state for WAV encoding
+_tls = threading.local()
+
+
+def _encode_audio_bytes(audio: np.ndarray, fmt: str = 'wav') -> bytes:
+    """Encode audio through a reusable per-thread buffer.
+
+    Rewinding and truncating the same BytesIO keeps its backing allocation
+    alive across requests instead of growing a fresh buffer every time.
+    """
+    sf_format, sf_subtype, _, _ = _AUDIO_FORMATS[fmt]
+    buf = getattr(_tls, 'wav_buf', None)
+    if buf is None:
+        buf = _tls.wav_buf = io.BytesIO()
+    buf.seek(0)
+    buf.truncate()
+    sf.write(buf, audio, 24000, format=sf_format, subtype=sf_subtype)
+    return buf.getvalue()
+
+
+# Per-process model handle for synthesis workers
+_worker_tts = None
+
+
+def _worker_init(model_name: str, cache_dir: str) -> None:
+    """Load the model once in each synthesis worker process.
+
+    Each worker runs its ONNX session single-threaded; parallelism comes from
+    the pool itself, so more intra-op threads would only oversubscribe cores.
+    """
+    global _worker_tts
+    os.environ["KITTENTTS_INTRA_OP_THREADS"] = "1"
+    _worker_tts = KittenTTS(model_name, cache_dir=cache_dir)
+
+
+def _worker_generate(text: str, voice: str, speed: float) -> np.ndarray:
+    return _synthesize_audio_safe(_worker_tts, text, voice, speed)
+
+
+def _get_executor():
+    """Lazily start the synthesis process pool (None when KITTENTTS_WORKERS=0)."""
+    global _executor
+    if SYNTH_WORKERS <= 0:
+        return None
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                cache_dir = os.getenv("HF_HOME", str(Path(__file__).parent / ".cache" / "huggingface"))
+                # Spawned workers re-import this module; keep them from
+                # preloading a second model before _worker_init runs.
+                os.environ["KITTENTTS_PRELOAD"] = "0"
+                _executor = ProcessPoolExecutor(
+                    max_workers=SYNTH_WORKERS,
+                    mp_context=get_context("spawn"),
+                    initializer=_worker_init,
+                    initargs=(MODEL_NAME, cache_dir),
+                )
+    return _executor
+
+
+def _discard_executor(executor) -> None:
+    """Throw away a broken pool so the next request starts a fresh one."""
+    global _executor
+    with _executor_lock:
+        if _executor is executor:
+            _executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+@lru_cache(maxsize=256)
+def _synth_audio_bytes(text: str, voice: str, speed: float, fmt: str = 'wav') -> bytes:
+    """Synthesize text and return encoded audio, memoized per (text, voice, speed, format).
+
+    TTS inference dominates request cost, so repeat requests for the same
+    normalized input become a dict lookup instead of another ONNX run.
+    """
+    audio = None
+    executor = _get_executor()
+    if executor is not None:
+        try:
+            audio = executor.submit(_worker_generate, text, voice, speed).result(timeout=SYNTH_TIMEOUT_S)
+        except BrokenProcessPool:
+            # A dead worker (OOM is the usual suspect) must not wedge
+            # synthesis until restart: rebuild the pool and retry once.
+            _discard_executor(executor)
+            executor = _get_executor()
+            try:
+                audio = executor.submit(_worker_generate, text, voice, speed).result(timeout=SYNTH_TIMEOUT_S)
+            except BrokenProcessPool:
+                # Pool cannot come up at all; run in-process below instead.
+                _discard_executor(executor)
+
+    if audio is None:
+        model = get_model()
+        with _tts_lock:
+            audio = _synthesize_audio_safe(model, text, voice, speed)
+
+    return _encode_audio_bytes(audio, fmt)
+
+
+# Response chunk size for streamed WAV downloads
+_STREAM_CHUNK_BYTES = 64 * 1024
+
+
+def _stream_audio_response(audio_bytes: bytes, voice: str, fmt: str = 'wav') -> Response:
+    """Stream encoded audio with chunked writes instead of one buffered body.
+
+    Werkzeug pushes each chunk as it is yielded, so the client sees the first
+    bytes without waiting for the whole body to be copied into a BytesIO.
+    """
+    _, _, mimetype, ext = _AUDIO_FORMATS[fmt]
+
+    def _chunks():
+        for i in range(0, len(audio_bytes), _STREAM_CHUNK_BYTES):
+            yield audio_bytes[i:i + _STREAM_CHUNK_BYTES]
+
+    headers = {
+        'Content-Disposition': f'attachment; filename=kitten_tts_{voice}{ext}',
+        'Content-Length': str(len(audio_bytes)),
+    }
+    return Response(stream_with_context(_chunks()), mimetype=mimetype, headers=headers)
+
+
+@lru_cache(maxsize=256)
+def _synth_audio_b64(text: str, voice: str, speed: float, fmt: str = 'wav') -> str:
+    """Base64 of the encoded audio, memoized so repeat streams skip the encode pass."""
+    return base64.b64encode(_synth_audio_bytes(text, voice, speed, fmt)).decode('utf-8')
+
+
 def get_model():
-    """Lazy load the TTS model."""
+    """Load the TTS model, once, regardless of how many threads race here."""
     global tts
     if tts is None:
-        print(f"Loading KittenTTS model: {MODEL_NAME}")
-        cache_dir = os.getenv("HF_HOME", str(Path(__file__).parent / ".cache" / "huggingface"))
-        Path(cache_dir).mkdir(parents=True, exist_ok=True)
-        tts = KittenTTS(MODEL_NAME, cache_dir=cache_dir)
+        with _tts_lock:
+            if tts is None:
+                print(f"Loading KittenTTS model: {MODEL_NAME}")
+                cache_dir = os.getenv("HF_HOME", str(Path(__file__).parent / ".cache" / "huggingface"))
+                Path(cache_dir).mkdir(parents=True, exist_ok=True)
+                tts = KittenTTS(MODEL_NAME, cache_dir=cache_dir)
     return tts
 
 
+def _preload_model() -> None:
+    """Load and warm up the model at startup so the first request only pays inference.
+
+    The dummy generate triggers ONNX session graph optimization and allocator
+    warmup. Disable with KITTENTTS_PRELOAD=0 (e.g. for quick local edits).
+    """
+    try:
+        executor = _get_executor()
+        if executor is not None:
+            executor.submit(_worker_generate, "warmup.", 'Jasper', 1.0).result(timeout=SYNTH_TIMEOUT_S)
+        else:
+            model = get_model()
+            model.generate("warmup.", voice='Jasper', speed=1.0)
+        print("Model preloaded and warmed up")
+    except Exception as e:
+        print(f"Model preload failed (will retry lazily): {e}")
+
+
+if os.environ.get("KITTENTTS_PRELOAD", "1") == "1":
+    _preload_model()
+
+
 @app.route('/')
 def index():
     """Render the main web interface."""
@@ -149,7 +515,15 @@ def generate_audio():
         if not isinstance(data, dict):
             return jsonify({'error': 'Invalid JSON payload'}), 400
 
-        text = _normalize_input_text(data.get('text', ''))
+        # Cheap gate before the regex pass: abusive payloads (megabytes of
+        # whitespace) must not get a normalization run for free.
+        raw_text = data.get('text', '')
+        if not isinstance(raw_text, str):
+            return jsonify({'error': 'Text must be a string'}), 400
+        if len(raw_text) > MAX_TEXT_LEN * 4:
+            return jsonify({'error': f'Text is too long (max {MAX_TEXT_LEN} characters)'}), 400
+
+        text = _normalize_input_text(raw_text)
         voice = data.get('voice', 'Jasper')
         try:
             speed = float(data.get('speed', 1.0))
@@ -168,23 +542,31 @@ def generate_audio():
         if speed < 0.5 or speed > 2.0:
             return jsonify({'error': 'Speed must be between 0.5 and 2.0'}), 400
 
-        # Generate audio
+        fmt = _choose_audio_format(data)
+        if fmt is None:
+            return jsonify({'error': f"Invalid format: {data.get('format')}"}), 400
+
+        speed = round(speed, 2)
+        mimetype, ext = _AUDIO_FORMATS[fmt][2:]
+
+        # On-disk cache hit: stream the file directly, surviving restarts
+        cache_path = _cache_path(text, voice, speed, fmt)
+        if cache_path.exists():
+            return send_file(
+                cache_path,
+                mimetype=mimetype,
+                as_attachment=True,
+                download_name=f'kitten_tts_{voice}{ext}',
+                conditional=True
+            )
+
+        # Generate audio (cached across identical requests)
         print(f"Generating audio: text='{text[:50]}...', voice={voice}, speed={speed}")
-        model = get_model()
-        audio = _synthesize_audio_safe(model, text, voice, speed)
+        audio_bytes = _synth_audio_bytes(text, voice, speed, fmt)
+        _store_audio_in_cache(cache_path, audio_bytes)
 
-        # Convert audio to WAV format in memory
-        audio_buffer = io.BytesIO()
-        sf.write(audio_buffer, audio, 24000, format='WAV')
-        audio_buffer.seek(0)
-
-        # Return audio file
-        return send_file(
-            audio_buffer,
-            mimetype='audio/wav',
-            as_attachment=True,
-            download_name=f'kitten_tts_{voice}.wav'
-        )
+        # Return audio file with chunked writes
+        return _stream_audio_response(audio_bytes, voice, fmt)
 
     except Exception as e:
         print(f"Error generating audio: {str(e)}")
@@ -199,7 +581,15 @@ def generate_audio_stream():
         if not isinstance(data, dict):
             return jsonify({'error': 'Invalid JSON payload'}), 400
 
-        text = _normalize_input_text(data.get('text', ''))
+        # Cheap gate before the regex pass: abusive payloads (megabytes of
+        # whitespace) must not get a normalization run for free.
+        raw_text = data.get('text', '')
+        if not isinstance(raw_text, str):
+            return jsonify({'error': 'Text must be a string'}), 400
+        if len(raw_text) > MAX_TEXT_LEN * 4:
+            return jsonify({'error': f'Text is too long (max {MAX_TEXT_LEN} characters)'}), 400
+
+        text = _normalize_input_text(raw_text)
         voice = data.get('voice', 'Jasper')
         try:
             speed = float(data.get('speed', 1.0))
@@ -218,23 +608,19 @@ def generate_audio_stream():
         if speed < 0.5 or speed > 2.0:
             return jsonify({'error': 'Speed must be between 0.5 and 2.0'}), 400
 
-        # Generate audio
-        print(f"Generating audio stream: text='{text[:50]}...', voice={voice}, speed={speed}")
-        model = get_model()
-        audio = _synthesize_audio_safe(model, text, voice, speed)
+        fmt = _choose_audio_format(data)
+        if fmt is None:
+            return jsonify({'error': f"Invalid format: {data.get('format')}"}), 400
 
-        # Convert audio to WAV format in memory
-        audio_buffer = io.BytesIO()
-        sf.write(audio_buffer, audio, 24000, format='WAV')
-        audio_buffer.seek(0)
+        mimetype = _AUDIO_FORMATS[fmt][2]
 
-        # Convert to base64 for embedding in HTML
-        import base64
-        audio_base64 = base64.b64encode(audio_buffer.getvalue()).decode('utf-8')
+        # Generate audio (encoded bytes and base64 both cached across identical requests)
+        print(f"Generating audio stream: text='{text[:50]}...', voice={voice}, speed={speed}")
+        audio_base64 = _synth_audio_b64(text, voice, round(speed, 2), fmt)
 
         return jsonify({
             'success': True,
-            'audio': f'data:audio/wav;base64,{audio_base64}',
+            'audio': f'data:{mimetype};base64,{audio_base64}',
             'text': text,
             'voice': voice
         })
@@ -1,9 +1,71 @@
 import json
 import os
+from pathlib import Path
+
 from huggingface_hub import hf_hub_download
 from .onnx_model import KittenTTS_1_Onnx
 
 
+def _maybe_quantize_int8(model_path):
+    """Return the path of an int8-quantized copy of the model, building it if needed.
+
+    Dynamic int8 quantization halves memory traffic on the decoder's
+    weight-heavy matmuls and typically gives a 2-3x CPU speedup. The quantized
+    file is cached next to the downloaded fp32 model; any failure (old
+    onnxruntime without quantization tooling, read-only cache, ...) falls back
+    to the fp32 path.
+    """
+    int8_path = Path(model_path).with_suffix(".int8.onnx")
+    if int8_path.exists():
+        return str(int8_path)
+
+    # Quantize into a per-process temp file and rename into place so a crash
+    # or a concurrently quantizing worker never exposes a half-written model.
+    tmp_path = int8_path.with_name(f"{int8_path.name}.{os.getpid()}.tmp")
+    try:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        quantize_dynamic(model_path, str(tmp_path), weight_type=QuantType.QInt8)
+        os.replace(tmp_path, int8_path)
+        return str(int8_path)
+    except Exception as e:
+        print(f"int8 quantization unavailable, using fp32 model: {e}")
+        tmp_path.unlink(missing_ok=True)
+        return model_path
+
+
+def _maybe_convert_half_float(model_path):
+    """Return the path of a half-precision copy of the model, building it if needed.
+
+    The decoder is memory-bandwidth-bound, so halving weight bytes roughly
+    halves traffic on its hot matmul/conv kernels. onnxruntime's CPU provider
+    has no usable bfloat16 kernels, so the conversion targets float16 (same
+    bandwidth win) via onnxconverter_common (install the "fp16" extra),
+    keeping fp32 graph inputs and outputs. The converted file is cached next
+    to the downloaded fp32 model; failures fall back to the fp32 path.
+    """
+    half_path = Path(model_path).with_suffix(".fp16.onnx")
+    if half_path.exists():
+        return str(half_path)
+
+    # Same temp-and-rename dance as the int8 helper: never expose a
+    # half-written model file to concurrent loaders.
+    tmp_path = half_path.with_name(f"{half_path.name}.{os.getpid()}.tmp")
+    try:
+        import onnx
+        from onnxconverter_common import float16
+
+        model = onnx.load(model_path)
+        model_half = float16.convert_float_to_float16(model, keep_io_types=True)
+        onnx.save(model_half, str(tmp_path))
+        os.replace(tmp_path, half_path)
+        return str(half_path)
+    except Exception as e:
+        print(f"fp16 conversion unavailable, using fp32 model: {e}")
+        tmp_path.unlink(missing_ok=True)
+        return model_path
+
+
 class KittenTTS:
     """Main KittenTTS class for text-to-speech synthesis."""
     
@@ -35,7 +97,20 @@ class KittenTTS:
             Audio data as numpy array
         """
         return self.model.generate(text, voice=voice, speed=speed)
-    
+
+    def generate_batch(self, texts, voice="expr-voice-5-m", speed=1.0):
+        """Generate audio for a list of pre-chunked texts in one call.
+
+        Args:
+            texts: List of text chunks to synthesize, in order
+            voice: Voice to use for synthesis
+            speed: Speech speed (1.0 = normal)
+
+        Returns:
+            Audio data as numpy array
+        """
+        return self.model.generate_batch(texts, voice=voice, speed=speed)
+
     def generate_to_file(self, text, output_path, voice="expr-voice-5-m", speed=1.0, sample_rate=24000):
         """Generate audio from text and save to file.
         
@@ -90,10 +165,27 @@ def download_from_huggingface(repo_id="KittenML/kitten-tts-nano-0.1", cache_dir=
         filename=config["voices"],
         cache_dir=cache_dir
     )
-    
+
+    # Pick the weight precision (int8 by default for CPU speed)
+    fp32_path = model_path
+    precision = os.getenv("KITTENTTS_PRECISION", "int8")
+    if precision == "int8":
+        model_path = _maybe_quantize_int8(model_path)
+    elif precision in ("bf16", "fp16"):
+        model_path = _maybe_convert_half_float(model_path)
+
     # Instantiate and return model
-    model = KittenTTS_1_Onnx(model_path=model_path, voices_path=voices_path, speed_priors=config.get("speed_priors", {}) , voice_aliases=config.get("voice_aliases", {}))
-    
+    try:
+        model = KittenTTS_1_Onnx(model_path=model_path, voices_path=voices_path, speed_priors=config.get("speed_priors", {}) , voice_aliases=config.get("voice_aliases", {}))
+    except Exception as e:
+        if model_path == fp32_path:
+            raise
+        # A corrupt or incompatible precision variant must not brick loading:
+        # drop it so it gets rebuilt and fall back to the fp32 model.
+        print(f"Failed to load {model_path}, falling back to fp32 model: {e}")
+        Path(model_path).unlink(missing_ok=True)
+        model = KittenTTS_1_Onnx(model_path=fp32_path, voices_path=voices_path, speed_priors=config.get("speed_priors", {}) , voice_aliases=config.get("voice_aliases", {}))
+
     return model
 
 
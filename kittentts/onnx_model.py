@@ -1,3 +1,6 @@
+import os
+from functools import lru_cache
+
 from misaki import en, espeak
 import numpy as np
 import phonemizer
@@ -5,6 +8,25 @@ import soundfile as sf
 import onnxruntime as ort
 from .preprocess import TextPreprocessor
 
+
+def _make_session_options():
+    """Session options tuned for CPU inference."""
+    sess_options = ort.SessionOptions()
+    sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    default_threads = max(1, (os.cpu_count() or 2) // 2)
+    sess_options.intra_op_num_threads = int(os.getenv("KITTENTTS_INTRA_OP_THREADS", default_threads))
+    sess_options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    sess_options.enable_cpu_mem_arena = True
+    # Input length varies per request; memory-pattern replay only helps
+    # static shapes and wastes planning work here.
+    sess_options.enable_mem_pattern = False
+    return sess_options
+
+
+def _optimized_graph_path(model_path):
+    """Path of the serialized pre-optimized graph for a model file."""
+    return f"{os.path.splitext(model_path)[0]}.opt.onnx"
+
 def basic_english_tokenize(text):
     """Basic English tokenizer that splits on whitespace and punctuation."""
     import re
@@ -86,9 +108,43 @@ class KittenTTS_1_Onnx:
             voices_path: Path to the voices NPZ file
         """
         self.model_path = model_path
-        self.voices = np.load(voices_path) 
-        self.session = ort.InferenceSession(model_path)
-        
+        self.voices = np.load(voices_path)
+
+        # Reuse a previously serialized optimized graph when available;
+        # otherwise optimize now and serialize for the next start.
+        opt_path = _optimized_graph_path(model_path)
+        self.session = None
+        if os.path.exists(opt_path):
+            try:
+                self.session = ort.InferenceSession(
+                    opt_path,
+                    sess_options=_make_session_options(),
+                    providers=["CPUExecutionProvider"],
+                )
+            except Exception:
+                # e.g. half-written by a process that is still serializing;
+                # rebuild from the source model instead.
+                self.session = None
+
+        if self.session is None:
+            sess_options = _make_session_options()
+            # ORT writes the serialized graph non-atomically, so point it at a
+            # per-process temp file and rename into place once the session is up.
+            tmp_opt_path = None
+            if os.access(os.path.dirname(model_path) or ".", os.W_OK):
+                tmp_opt_path = f"{opt_path}.{os.getpid()}.tmp"
+                sess_options.optimized_model_filepath = tmp_opt_path
+            self.session = ort.InferenceSession(
+                model_path,
+                sess_options=sess_options,
+                providers=["CPUExecutionProvider"],
+            )
+            if tmp_opt_path is not None:
+                try:
+                    os.replace(tmp_opt_path, opt_path)
+                except OSError:
+                    pass
+
         self.phonemizer = phonemizer.backend.EspeakBackend(
             language="en-us", preserve_punctuation=True, with_stress=True
         )
@@ -103,40 +159,56 @@ class KittenTTS_1_Onnx:
         self.voice_aliases = voice_aliases
 
         self.preprocessor = TextPreprocessor()
-    
-    def _prepare_inputs(self, text: str, voice: str, speed: float = 1.0) -> dict:
-        """Prepare ONNX model inputs from text and voice parameters."""
+
+        # Short phrases dominate interactive traffic and repeat often; memoize
+        # their prepared inputs so repeats skip the espeak phonemizer
+        # round-trip and token/array construction entirely.
+        self._prepare_inputs_cached = lru_cache(maxsize=512)(self._prepare_inputs)
+        self.input_cache_max_len = 100
+
+    def _resolve_voice(self, voice: str, speed: float):
+        """Resolve voice aliases and apply per-voice speed priors."""
         if voice in self.voice_aliases:
             voice = self.voice_aliases[voice]
 
         if voice not in self.available_voices:
             raise ValueError(f"Voice '{voice}' not available. Choose from: {self.available_voices}")
-        
+
         if voice in self.speed_priors:
             speed = speed * self.speed_priors[voice]
-        
-        # Phonemize the input text
-        phonemes_list = self.phonemizer.phonemize([text])
-        
-        # Process phonemes to get token IDs
-        phonemes = basic_english_tokenize(phonemes_list[0])
+
+        return voice, speed
+
+    def _inputs_from_phonemes(self, phonemes_raw: str, text: str, voice: str, speed: float) -> dict:
+        """Build the ONNX input dict from already-phonemized text."""
+        phonemes = basic_english_tokenize(phonemes_raw)
         phonemes = ' '.join(phonemes)
         tokens = self.text_cleaner(phonemes)
-        
+
         # Add start and end tokens
         tokens.insert(0, 0)
         tokens.append(0)
-        
+
         input_ids = np.array([tokens], dtype=np.int64)
-        ref_id =  min(len(text), self.voices[voice].shape[0] - 1)
+        ref_id = min(len(text), self.voices[voice].shape[0] - 1)
         ref_s = self.voices[voice][ref_id:ref_id+1]
-        
+
         return {
             "input_ids": input_ids,
             "style": ref_s,
             "speed": np.array([speed], dtype=np.float32),
         }
-    
+
+    def _prepare_inputs(self, text: str, voice: str, speed: float = 1.0) -> dict:
+        """Prepare ONNX model inputs from text and voice parameters."""
+        voice, speed = self._resolve_voice(voice, speed)
+
+        # Phonemize the input text
+        phonemes_list = self.phonemizer.phonemize([text])
+
+        return self._inputs_from_phonemes(phonemes_list[0], text, voice, speed)
+
+
     def generate(self, text: str, voice: str = "expr-voice-5-m", speed: float = 1.0, clean_text: bool=True) -> np.ndarray:
         out_chunks = []
         if clean_text:
@@ -145,6 +217,42 @@ class KittenTTS_1_Onnx:
             out_chunks.append(self.generate_single_chunk(text_chunk, voice, speed))
         return np.concatenate(out_chunks, axis=-1)
 
+    def generate_batch(self, texts, voice: str = "expr-voice-5-m", speed: float = 1.0, clean_text: bool = True) -> np.ndarray:
+        """Synthesize several pre-chunked texts and concatenate the audio.
+
+        Phonemization (an espeak round-trip per call) is batched into a single
+        call for all chunks. The exported graph has no length mask, so padded
+        [B, T] inference cannot be un-padded on output; session.run stays
+        per-chunk, but per-chunk Python and phonemizer overhead is amortized.
+
+        Args:
+            texts: List of text chunks to synthesize, in order
+            voice: Voice to use for synthesis
+            speed: Speech speed (1.0 = normal)
+            clean_text: If true, it will cleanup the text. Eg. replace numbers with words.
+
+        Returns:
+            Audio data as numpy array
+        """
+        # Mirror the single-text generate path: preprocess each chunk, then
+        # make sure it ends with punctuation like chunk_text does.
+        if clean_text:
+            texts = [self.preprocessor(t) for t in texts]
+        texts = [ensure_punctuation(t) for t in texts if t.strip()]
+        if not texts:
+            raise ValueError("No text to synthesize.")
+
+        voice, speed = self._resolve_voice(voice, speed)
+        phonemes_list = self.phonemizer.phonemize(texts)
+
+        out_chunks = []
+        for text, phonemes_raw in zip(texts, phonemes_list):
+            onnx_inputs = self._inputs_from_phonemes(phonemes_raw, text, voice, speed)
+            outputs = self.session.run(None, onnx_inputs)
+            out_chunks.append(outputs[0][..., :-5000])
+
+        return np.concatenate(out_chunks, axis=-1)
+
     def generate_single_chunk(self, text: str, voice: str = "expr-voice-5-m", speed: float = 1.0) -> np.ndarray:
         """Synthesize speech from text.
         
@@ -156,8 +264,11 @@ class KittenTTS_1_Onnx:
         Returns:
             Audio data as numpy array
         """
-        onnx_inputs = self._prepare_inputs(text, voice, speed)
-        
+        if len(text) <= self.input_cache_max_len:
+            onnx_inputs = self._prepare_inputs_cached(text, voice, speed)
+        else:
+            onnx_inputs = self._prepare_inputs(text, voice, speed)
+
         outputs = self.session.run(None, onnx_inputs)
         
         # Trim audio
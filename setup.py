@@ -33,11 +33,15 @@ setup(
         "spacy",
         "espeakng_loader",
         "misaki[en]>=0.9.4",
+        "onnx",
         "onnxruntime",
         "soundfile",
         "numpy",
         "huggingface_hub",
     ],
+    extras_require={
+        "fp16": ["onnxconverter-common"],
+    },
     keywords="text-to-speech, tts, speech-synthesis, neural-networks, onnx",
     project_urls={
         "Bug Reports": "https://github.com/kittenml/kittentts/issues",